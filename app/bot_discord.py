@@ -1,16 +1,32 @@
 import discord
 from discord.ext import commands
-import requests  # type: ignore
 import aiohttp
+import orjson
 import asyncio
 import base64
+import functools
+import logging
+import logging.handlers
+import queue
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 import os
-from typing import Optional, List, Dict, Any
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Awaitable
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:
+    # uvloop is optional (not available on Windows): fall back to the default asyncio loop
+    uvloop = None
+
 load_dotenv()
 
+logger = logging.getLogger('bot_discord')
+
 # Tokens depuis variables d'environnement
 DISCORD_TOKEN = os.getenv('DISCORD_TOKEN') or ''
 GITHUB_TOKEN = os.getenv('GITHUB_TOKEN') or ''
@@ -19,24 +35,227 @@ GITHUB_REPO = os.getenv('GITHUB_REPO') or ''
 ISSUES_CHANNEL_ID = int(os.getenv('ISSUES_CHANNEL_ID', '0'))
 STAFF_ROLE = os.getenv('STAFF_ROLE', 'Staff')
 BETA_TESTER_ROLE = os.getenv('BETA_TESTER_ROLE', 'BetaTester')
+ALLOWED_ROLES = frozenset({STAFF_ROLE, BETA_TESTER_ROLE})  # Roles allowed to validate/reject issues
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+
+# Commande !issues : couleurs des embeds par état et taille des pages
+ISSUE_STATE_COLORS = MappingProxyType({'open': 0x28a745, 'closed': 0x6f42c1, 'all': 0x0366d6})
+ISSUES_PER_PAGE = 10
 
 # Configuration du kanban GitHub Projects
 PROJECT_ID = os.getenv('PROJECT_ID', '')
 PROJECT_FIELD_STATUS = os.getenv('PROJECT_FIELD_STATUS', 'Status')
 PROJECT_STATUS_TODO = os.getenv('PROJECT_STATUS_TODO', 'Backlog')
+# Durée de cache des infos du projet (champs et colonnes changent rarement)
+PROJECT_INFO_CACHE_TTL = 600
+
+# Durée de vie d'une issue en attente de validation, puis nombre maximum d'issues en attente
+PENDING_ISSUE_TTL = int(os.getenv('PENDING_ISSUE_TTL', '86400'))
+PENDING_ISSUE_MAX = 1024
+
+# Limites d'appels vers l'API GitHub : la concurrence s'adapte entre MIN et MAX,
+# réduite de GITHUB_OVERLOAD_DECREASE à chaque rate limit
+GITHUB_MIN_CONCURRENCY = 2
+GITHUB_INITIAL_CONCURRENCY = 8
+GITHUB_MAX_CONCURRENCY = 16
+GITHUB_OVERLOAD_DECREASE = 0.1
+GITHUB_MAX_RETRIES = 3
+GITHUB_MAX_BACKOFF = 60
+
+GITHUB_API_URL = 'https://api.github.com'
+GITHUB_GRAPHQL_URL = f'{GITHUB_API_URL}/graphql'
+
+# Requêtes GraphQL (Projects v2)
+PROJECT_INFO_QUERY = """
+query($projectId: ID!) {
+    node(id: $projectId) {
+        ... on ProjectV2 {
+            id
+            title
+            fields(first: 20) {
+                nodes {
+                    ... on ProjectV2Field {
+                        id
+                        name
+                    }
+                    ... on ProjectV2SingleSelectField {
+                        id
+                        name
+                        options {
+                            id
+                            name
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+ADD_PROJECT_ITEM_MUTATION = """
+mutation($projectId: ID!, $contentId: ID!) {
+    addProjectV2ItemById(input: {
+        projectId: $projectId
+        contentId: $contentId
+    }) {
+        item {
+            id
+        }
+    }
+}
+"""
+
+UPDATE_ITEM_STATUS_MUTATION = """
+mutation($projectId: ID!, $itemId: ID!, $fieldId: ID!, $value: ProjectV2FieldValue!) {
+    updateProjectV2ItemFieldValue(input: {
+        projectId: $projectId
+        itemId: $itemId
+        fieldId: $fieldId
+        value: $value
+    }) {
+        projectV2Item {
+            id
+        }
+    }
+}
+"""
+
+ISSUE_NODE_ID_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!) {
+    repository(owner: $owner, name: $repo) {
+        issue(number: $number) {
+            id
+        }
+    }
+}
+"""
+
+class IssuesBot(commands.Bot):
+    """Bot that manages the shared GitHub session and registers the persistent issue view"""
+    
+    async def setup_hook(self):
+        await github.open()
+        # Une seule vue pour tous les messages d'issue, qui survit aux redémarrages
+        self.issue_view = ChannelIssueView()
+        self.add_view(self.issue_view)
+    
+    async def close(self):
+        await github.close()
+        await super().close()
 
 # Bot configuration
 try:
     intents = discord.Intents.default()
     intents.message_content = True
-    bot = commands.Bot(command_prefix='!', intents=intents)
+    bot = IssuesBot(command_prefix='!', intents=intents)
 except AttributeError:
     # Fallback for older discord.py versions
-    bot = commands.Bot(command_prefix='!')
+    bot = IssuesBot(command_prefix='!')
+
+@dataclass(slots=True)
+class UploadedFile:
+    """File uploaded to GitHub for a pending issue"""
+    filename: str
+    url: str
+    discord_url: str
 
-# Temporary storage for pending issues and channel messages
-pending_issues: Dict[str, Dict[str, Any]] = {}
-channel_messages: Dict[str, discord.Message] = {}  # Store channel messages by issue_id
+@dataclass(slots=True)
+class PendingIssue:
+    """Issue waiting for validation in the issues channel"""
+    title: str
+    description: str
+    uploaded_images: List[UploadedFile] = field(default_factory=list)
+    labels: List[str] = field(default_factory=list)
+    message: Optional[discord.Message] = None  # Message de l'issue dans le salon
+    upload_message: Optional[discord.Message] = None  # Message d'instruction d'upload en cours
+
+class PendingIssueStore(TTLCache):
+    """Expiring store of pending issues
+    
+    Issues expire after PENDING_ISSUE_TTL seconds (or are evicted once
+    PENDING_ISSUE_MAX is reached); their channel messages are kept aside
+    so cleanup_old_issue_messages can delete them.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.stale_messages: Dict[str, discord.Message] = {}
+    
+    def _forget(self, issue_id: str, issue: PendingIssue):
+        if issue.message:
+            self.stale_messages[issue_id] = issue.message
+    
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for issue_id, issue in expired:
+            self._forget(issue_id, issue)
+        return expired
+    
+    def popitem(self):
+        issue_id, issue = super().popitem()
+        self._forget(issue_id, issue)
+        return issue_id, issue
+    
+    def has_stale_messages(self) -> bool:
+        """Expire outdated issues and tell whether channel messages are left to delete"""
+        self.expire()
+        return bool(self.stale_messages)
+    
+    def pop_stale_messages(self) -> Dict[str, discord.Message]:
+        """Return and forget the channel messages of expired issues"""
+        self.expire()
+        stale_messages, self.stale_messages = self.stale_messages, {}
+        return stale_messages
+
+class AdaptiveConcurrencyLimiter:
+    """Async concurrency limit that adapts to server pushback (AIMD)
+    
+    The limit drops by a fraction of itself on every overloaded response and
+    grows by one after a full window of successful ones, staying between
+    `minimum` and `maximum`.
+    """
+    
+    def __init__(self, initial: int, minimum: int, maximum: int, decrease: float):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self._in_flight = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+    
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+    
+    async def __aexit__(self, *exc_info):
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+    
+    def record(self, overloaded: bool):
+        """Adjust the limit from the outcome of a request"""
+        if overloaded:
+            self._successes = 0
+            self.limit = max(self.minimum, int(self.limit * (1 - self.decrease)))
+        else:
+            self._successes += 1
+            if self._successes >= self.limit:
+                self._successes = 0
+                self.limit = min(self.maximum, self.limit + 1)
+
+# Préfixe du footer de l'embed : porte l'issue_id pour la vue persistante
+ISSUE_ID_FOOTER_PREFIX = 'Issue ID: '
+
+# Temporary storage for pending issues (with their channel messages)
+pending_issues: PendingIssueStore = PendingIssueStore(maxsize=PENDING_ISSUE_MAX, ttl=PENDING_ISSUE_TTL)
+_project_info_cache: Dict[str, tuple[float, Dict[str, Any]]] = {}  # project_id -> (fetched_at, project info)
+_background_tasks: set[asyncio.Task] = set()  # Strong references to fire-and-forget tasks
+_gh_limiter = AdaptiveConcurrencyLimiter(  # Gates every request sent to GitHub
+    GITHUB_INITIAL_CONCURRENCY, GITHUB_MIN_CONCURRENCY, GITHUB_MAX_CONCURRENCY, GITHUB_OVERLOAD_DECREASE
+)
 
 class GitHubAPI:
     """Handles GitHub API interactions"""
@@ -45,6 +264,8 @@ class GitHubAPI:
         self.token = token
         self.owner = owner
         self.repo = repo
+        self._issues_url = f'{GITHUB_API_URL}/repos/{owner}/{repo}/issues'
+        self._contents_url_prefix = f'{GITHUB_API_URL}/repos/{owner}/{repo}/contents/assets/discord-images/'
         self.headers = {
             'Authorization': f'token {token}',
             'Accept': 'application/vnd.github.v3+json'
@@ -54,6 +275,91 @@ class GitHubAPI:
             'Authorization': f'Bearer {token}',
             'Content-Type': 'application/json'
         }
+        # Session partagée (keep-alive + pool de connexions vers api.github.com)
+        self.session: Optional[aiohttp.ClientSession] = None
+        # Compteurs pour le suivi de la consommation d'API
+        self.rest_calls = 0
+        self.graphql_calls = 0
+        self.retries = 0
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, limit_per_host=32, keepalive_timeout=75, ttl_dns_cache=300),
+                json_serialize=lambda obj: orjson.dumps(obj).decode('utf-8')
+            )
+        return self.session
+    
+    async def open(self):
+        """Create the shared HTTP session ahead of the first request"""
+        await self._get_session()
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        logger.info("GitHub API usage: %d REST calls, %d GraphQL calls, %d retries",
+                    self.rest_calls, self.graphql_calls, self.retries)
+        if self.session and not self.session.closed:
+            await self.session.close()
+    
+    async def _request(self, method: str, url: str, retry_5xx: bool = True, **kwargs) -> aiohttp.ClientResponse:
+        """Send a request to GitHub, retrying on rate limits and transient errors
+        
+        The body is read before the connection is released, so the returned
+        response can still be used with .json() / .text(). Pass retry_5xx=False
+        for non-idempotent writes: GitHub may apply them and still answer 502.
+        """
+        session = await self._get_session()
+        attempt = 0
+        while True:
+            async with _gh_limiter:
+                if url == GITHUB_GRAPHQL_URL:
+                    self.graphql_calls += 1
+                else:
+                    self.rest_calls += 1
+                async with session.request(method, url, **kwargs) as response:
+                    await response.read()
+                _gh_limiter.record(overloaded=self._is_rate_limited(response))
+            
+            delay = self._retry_delay(response, attempt, retry_5xx)
+            if delay is None or attempt >= GITHUB_MAX_RETRIES:
+                return response
+            attempt += 1
+            self.retries += 1
+            logger.warning("GitHub %s %s returned %s, retrying in %.0fs (%d retries so far)",
+                           method, url, response.status, delay, self.retries)
+            await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _is_rate_limited(response: aiohttp.ClientResponse) -> bool:
+        """Tell whether GitHub rejected the request because of a (secondary) rate limit"""
+        if response.status == 429:
+            return True
+        # 403 sans en-tête de rate limit : erreur de permission
+        return response.status == 403 and (
+            'Retry-After' in response.headers or response.headers.get('X-RateLimit-Remaining') == '0'
+        )
+    
+    @classmethod
+    def _retry_delay(cls, response: aiohttp.ClientResponse, attempt: int, retry_5xx: bool = True) -> Optional[float]:
+        """Return the delay before retrying this response, or None if it should not be retried"""
+        backoff = min(2 ** attempt, GITHUB_MAX_BACKOFF)
+        
+        if cls._is_rate_limited(response):
+            retry_after = response.headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                delay = float(retry_after)
+            elif response.headers.get('X-RateLimit-Remaining') == '0':
+                reset = float(response.headers.get('X-RateLimit-Reset', '0'))
+                delay = max(reset - time.time(), 1)
+            else:
+                delay = backoff
+            # Ne pas bloquer une interaction Discord pendant de longues minutes
+            return delay if delay <= GITHUB_MAX_BACKOFF else None
+        
+        if retry_5xx and response.status in (502, 503, 504):
+            return backoff
+        return None
     
     async def upload_image_to_github(self, image_data: bytes, filename: str) -> Optional[str]:
         """Upload an image to GitHub and return the URL"""
@@ -63,43 +369,49 @@ class GitHubAPI:
             safe_filename = f"{timestamp}_{filename}"
             
             # Upload via GitHub Contents API
-            path = f'assets/discord-images/{safe_filename}'
-            url = f'https://api.github.com/repos/{self.owner}/{self.repo}/contents/{path}'
+            url = f'{self._contents_url_prefix}{safe_filename}'
             
-            data = {
-                'message': f'Upload image from Discord: {filename}',
-                'content': base64.b64encode(image_data).decode('utf-8'),
-            }
+            # Encoding a large video takes tens of ms of CPU: run it off the event loop
+            encoded = await asyncio.to_thread(base64.b64encode, image_data)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.put(url, json=data, headers=self.headers) as response:
-                    if response.status in [200, 201]:
-                        result = await response.json()
-                        return result['content']['download_url']
-                    else:
-                        print(f"GitHub upload error: {response.status} - {await response.text()}")
-                        return None
+            # Build the JSON body directly as bytes: the base64 output is ASCII and
+            # needs no escaping, so we skip the str copy and the JSON re-encoding pass
+            payload = bytearray(b'{"message":')
+            payload += orjson.dumps(f'Upload image from Discord: {filename}')
+            payload += b',"content":"'
+            payload += encoded
+            payload += b'"}'
+            del encoded
+            headers = {**self.headers, 'Content-Type': 'application/json'}
+            
+            response = await self._request('PUT', url, retry_5xx=False, data=payload, headers=headers)
+            if response.status in [200, 201]:
+                result = await response.json(loads=orjson.loads)
+                return result['content']['download_url']
+            else:
+                logger.error("GitHub upload error: %s - %s", response.status, await response.text())
+                return None
                         
-        except Exception as e:
-            print(f"Image upload error: {e}")
+        except Exception:
+            logger.exception("Image upload error")
             return None
     
-    def create_issue(self, title: str, body: str, labels: Optional[List[str]] = None) -> Dict[str, Any]:
+    async def create_issue(self, title: str, body: str, labels: Optional[List[str]] = None) -> Dict[str, Any]:
         """Create an issue on GitHub"""
-        url = f'https://api.github.com/repos/{self.owner}/{self.repo}/issues'
+        url = self._issues_url
         data = {
             'title': title,
             'body': body,
             'labels': labels or []
         }
         
-        response = requests.post(url, json=data, headers=self.headers)
+        response = await self._request('POST', url, retry_5xx=False, json=data, headers=self.headers)
         response.raise_for_status()
-        return response.json()
+        return await response.json(loads=orjson.loads)
     
-    def get_issues(self, state: str = 'open', per_page: int = 30, page: int = 1) -> List[Dict[str, Any]]:
+    async def get_issues(self, state: str = 'open', per_page: int = 30, page: int = 1) -> List[Dict[str, Any]]:
         """Get repository issues"""
-        url = f'https://api.github.com/repos/{self.owner}/{self.repo}/issues'
+        url = self._issues_url
         params = {
             'state': state,
             'per_page': per_page,
@@ -108,154 +420,134 @@ class GitHubAPI:
             'direction': 'desc'
         }
         
-        response = requests.get(url, params=params, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    
-    def get_issue(self, issue_number: int) -> Dict[str, Any]:
-        """Get a specific issue by number"""
-        url = f'https://api.github.com/repos/{self.owner}/{self.repo}/issues/{issue_number}'
-        response = requests.get(url, headers=self.headers)
+        response = await self._request('GET', url, params=params, headers=self.headers)
         response.raise_for_status()
-        return response.json()
+        return await response.json(loads=orjson.loads)
     
     async def get_project_info(self, project_id: str) -> Optional[Dict[str, Any]]:
-        """Récupère les informations du projet GitHub"""
-        query = """
-        query($projectId: ID!) {
-            node(id: $projectId) {
-                ... on ProjectV2 {
-                    id
-                    title
-                    fields(first: 20) {
-                        nodes {
-                            ... on ProjectV2Field {
-                                id
-                                name
-                            }
-                            ... on ProjectV2SingleSelectField {
-                                id
-                                name
-                                options {
-                                    id
-                                    name
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        }
-        """
+        """Récupère les informations du projet GitHub (mises en cache)"""
+        cached = _project_info_cache.get(project_id)
+        if cached and time.monotonic() - cached[0] < PROJECT_INFO_CACHE_TTL:
+            return cached[1]
         
         variables = {"projectId": project_id}
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                'https://api.github.com/graphql',
-                json={'query': query, 'variables': variables},
-                headers=self.graphql_headers
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result.get('data', {}).get('node')
-                else:
-                    print(f"Error getting project info: {response.status}")
-                    return None
+        response = await self._request(
+            'POST',
+            GITHUB_GRAPHQL_URL,
+            json={'query': PROJECT_INFO_QUERY, 'variables': variables},
+            headers=self.graphql_headers
+        )
+        if response.status == 200:
+            result = await response.json(loads=orjson.loads)
+            if 'errors' in result:
+                logger.error("GraphQL errors getting project info: %s", result['errors'])
+                _project_info_cache.pop(project_id, None)
+                return None
+            project_info = result.get('data', {}).get('node')
+            if project_info:
+                # Index des champs par nom, construit une fois par chargement
+                project_info['fields_by_name'] = {
+                    field['name']: field
+                    for field in project_info.get('fields', {}).get('nodes', [])
+                    if field.get('name')
+                }
+                _project_info_cache[project_id] = (time.monotonic(), project_info)
+            return project_info
+        else:
+            logger.error("Error getting project info: %s", response.status)
+            return None
+
+    def invalidate_project_info(self, project_id: str):
+        """Oublie les infos en cache du projet (champs ou colonnes modifiés)"""
+        _project_info_cache.pop(project_id, None)
 
     async def add_issue_to_project(self, project_id: str, issue_id: str, status_field_id: str, status_option_id: str) -> bool:
         """Ajoute une issue au projet kanban"""
         try:
             # 1. D'abord, ajouter l'item au projet
-            add_mutation = """
-            mutation($projectId: ID!, $contentId: ID!) {
-                addProjectV2ItemById(input: {
-                    projectId: $projectId
-                    contentId: $contentId
-                }) {
-                    item {
-                        id
-                    }
-                }
-            }
-            """
-            
             variables = {
                 "projectId": project_id,
                 "contentId": issue_id
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    'https://api.github.com/graphql',
-                    json={'query': add_mutation, 'variables': variables},
-                    headers=self.graphql_headers
-                ) as response:
-                    if response.status != 200:
-                        print(f"Error adding item to project: {response.status}")
-                        return False
-                    
-                    result = await response.json()
-                    if 'errors' in result:
-                        print(f"GraphQL errors: {result['errors']}")
-                        return False
-                    
-                    item_id = result.get('data', {}).get('addProjectV2ItemById', {}).get('item', {}).get('id')
-                    
-                    if not item_id:
-                        print("No item ID returned")
-                        return False
-                    
-                    # 2. Ensuite, définir le status
-                    update_mutation = """
-                    mutation($projectId: ID!, $itemId: ID!, $fieldId: ID!, $value: ProjectV2FieldValue!) {
-                        updateProjectV2ItemFieldValue(input: {
-                            projectId: $projectId
-                            itemId: $itemId
-                            fieldId: $fieldId
-                            value: $value
-                        }) {
-                            projectV2Item {
-                                id
-                            }
-                        }
-                    }
-                    """
-                    
-                    update_variables = {
-                        "projectId": project_id,
-                        "itemId": item_id,
-                        "fieldId": status_field_id,
-                        "value": {
-                            "singleSelectOptionId": status_option_id
-                        }
-                    }
-                    
-                    async with session.post(
-                        'https://api.github.com/graphql',
-                        json={'query': update_mutation, 'variables': update_variables},
-                        headers=self.graphql_headers
-                    ) as update_response:
-                        if update_response.status == 200:
-                            update_result = await update_response.json()
-                            if 'errors' in update_result:
-                                print(f"GraphQL errors in update: {update_result['errors']}")
-                                return False
-                            return True
-                        else:
-                            print(f"Error updating item status: {update_response.status}")
-                            return False
-        except Exception as e:
-            print(f"Exception in add_issue_to_project: {e}")
+            response = await self._request(
+                'POST',
+                GITHUB_GRAPHQL_URL,
+                retry_5xx=False,
+                json={'query': ADD_PROJECT_ITEM_MUTATION, 'variables': variables},
+                headers=self.graphql_headers
+            )
+            if response.status != 200:
+                logger.error("Error adding item to project: %s", response.status)
+                return False
+            
+            result = await response.json(loads=orjson.loads)
+            if 'errors' in result:
+                logger.error("GraphQL errors: %s", result['errors'])
+                return False
+            
+            item_id = result.get('data', {}).get('addProjectV2ItemById', {}).get('item', {}).get('id')
+            
+            if not item_id:
+                logger.error("No item ID returned")
+                return False
+            
+            # 2. Ensuite, définir le status. L'item ID n'est connu qu'après la première
+            # mutation : les deux requêtes ne peuvent pas être fusionnées, mais la seconde
+            # réutilise la connexion keep-alive libérée par la première.
+            update_variables = {
+                "projectId": project_id,
+                "itemId": item_id,
+                "fieldId": status_field_id,
+                "value": {
+                    "singleSelectOptionId": status_option_id
+                }
+            }
+            
+            update_response = await self._request(
+                'POST',
+                GITHUB_GRAPHQL_URL,
+                json={'query': UPDATE_ITEM_STATUS_MUTATION, 'variables': update_variables},
+                headers=self.graphql_headers
+            )
+            if update_response.status == 200:
+                update_result = await update_response.json(loads=orjson.loads)
+                if 'errors' in update_result:
+                    logger.error("GraphQL errors in update: %s", update_result['errors'])
+                    return False
+                return True
+            else:
+                logger.error("Error updating item status: %s", update_response.status)
+                return False
+        except Exception:
+            logger.exception("Exception in add_issue_to_project")
             return False
 
-    def get_issue_node_id(self, issue_number: int) -> Optional[str]:
-        """Récupère l'ID GraphQL d'une issue"""
+    async def get_issue_node_id(self, issue_number: int) -> Optional[str]:
+        """Récupère l'ID GraphQL d'une issue (sans télécharger toute l'issue)"""
+        variables = {"owner": self.owner, "repo": self.repo, "number": issue_number}
+        
         try:
-            issue = self.get_issue(issue_number)
-            return issue.get('node_id')
-        except Exception as e:
-            print(f"Error getting issue node ID: {e}")
+            response = await self._request(
+                'POST',
+                GITHUB_GRAPHQL_URL,
+                json={'query': ISSUE_NODE_ID_QUERY, 'variables': variables},
+                headers=self.graphql_headers
+            )
+            if response.status != 200:
+                logger.error("Error getting issue node ID: %s", response.status)
+                return None
+            
+            result = await response.json(loads=orjson.loads)
+            if 'errors' in result:
+                logger.error("GraphQL errors getting issue node ID: %s", result['errors'])
+                return None
+            
+            issue = ((result.get('data') or {}).get('repository') or {}).get('issue') or {}
+            return issue.get('id')
+        except Exception:
+            logger.exception("Error getting issue node ID")
             return None
 
 # GitHub API instance
@@ -263,42 +555,134 @@ github = GitHubAPI(GITHUB_TOKEN, GITHUB_OWNER, GITHUB_REPO)
 
 def is_staff_or_beta(member: discord.Member) -> bool:
     """Vérifie si le membre est staff ou beta-testeur"""
-    return any(role.name in [STAFF_ROLE, BETA_TESTER_ROLE] for role in member.roles)
+    return any(role.name in ALLOWED_ROLES for role in member.roles)
+
+def is_media_attachment(attachment: discord.Attachment) -> bool:
+    """Vérifie si la pièce jointe est une image ou une vidéo"""
+    return bool(attachment.content_type) and (
+        attachment.content_type.startswith('image/') or attachment.content_type.startswith('video/')
+    )
+
+async def upload_attachment(attachment: discord.Attachment) -> Optional[UploadedFile]:
+    """Download a Discord attachment and upload it to GitHub"""
+    file_data = await attachment.read()
+    file_url = await github.upload_image_to_github(file_data, attachment.filename)
+    if not file_url:
+        return None
+    return UploadedFile(
+        filename=attachment.filename,
+        url=file_url,
+        discord_url=attachment.url
+    )
+
+async def upload_attachments(attachments: List[discord.Attachment]) -> List[UploadedFile]:
+    """Upload all image/video attachments concurrently, skipping failed ones"""
+    media = [attachment for attachment in attachments if is_media_attachment(attachment)]
+    results = await asyncio.gather(*(upload_attachment(attachment) for attachment in media), return_exceptions=True)
+    
+    uploaded_files = []
+    for attachment, result in zip(media, results):
+        if isinstance(result, BaseException):
+            logger.error("Error uploading %s: %s", attachment.filename, result)
+        elif result:
+            uploaded_files.append(result)
+    return uploaded_files
+
+async def _safe_delete(delete_call: Awaitable[Any], label: str) -> bool:
+    """Await a Discord delete call, ignoring messages already gone or not deletable"""
+    try:
+        await delete_call
+        return True
+    except discord.HTTPException as e:
+        logger.debug("Could not delete %s: %s", label, e)
+        return False
 
 async def cleanup_old_issue_messages():
-    """Remove old issue messages from the channel"""
+    """Remove the messages of expired issues from the channel"""
+    stale_messages = pending_issues.pop_stale_messages()
+    if not stale_messages:
+        # Nothing stale: common case on submit
+        return
+    
     try:
-        # Get all current issue_ids
-        current_issue_ids = set(pending_issues.keys())
-        
-        # Find messages to delete (not in current pending issues)
-        messages_to_delete = []
-        for issue_id, message in list(channel_messages.items()):
-            if issue_id not in current_issue_ids:
-                messages_to_delete.append((issue_id, message))
-        
-        # Delete old messages
-        for issue_id, message in messages_to_delete:
-            try:
-                await message.delete()
-                del channel_messages[issue_id]
-            except discord.errors.NotFound:
-                # Message already deleted
-                del channel_messages[issue_id]
-            except Exception as e:
-                print(f"Error deleting message for issue {issue_id}: {e}")
-                
-    except Exception as e:
-        print(f"Error in cleanup_old_issue_messages: {e}")
+        # Messages whose issue is no longer pending, deleted concurrently
+        await asyncio.gather(*(
+            _safe_delete(message.delete(), f"message for issue {issue_id}")
+            for issue_id, message in stale_messages.items()
+        ))
+    except Exception:
+        logger.exception("Error in cleanup_old_issue_messages")
+
+def schedule_background_task(coro) -> asyncio.Task:
+    """Run a coroutine in the background, keeping a reference until it finishes"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
 
 @bot.event
 async def on_ready():
-    print(f'Bot {bot.user} is connected!')
+    logger.info('Bot %s is connected!', bot.user)
     channel = bot.get_channel(ISSUES_CHANNEL_ID)
     if channel:
-        print(f'Configured channel: #{channel.name} (ID: {ISSUES_CHANNEL_ID})')
+        logger.info('Configured channel: #%s (ID: %s)', channel.name, ISSUES_CHANNEL_ID)
     else:
-        print(f'Channel with ID {ISSUES_CHANNEL_ID} not found!')
+        logger.error('Channel with ID %s not found!', ISSUES_CHANNEL_ID)
+
+def build_issue_embed(issue_id: str, user: discord.User | discord.Member) -> discord.Embed:
+    """Create embed for issue display"""
+    if issue_id not in pending_issues:
+        return discord.Embed(
+            title='Error: Issue data not found',
+            color=discord.Color.red()
+        )
+
+    issue_data = pending_issues[issue_id]
+    title = issue_data.title
+    description = issue_data.description
+    
+    embed = discord.Embed(
+        title='🔍 New Issue',
+        color=0xffaa00,
+        timestamp=discord.utils.utcnow()
+    )
+    embed.add_field(name='Title', value=title, inline=False)
+    
+    desc_preview = description[:1024]
+    embed.add_field(name='Description', value=desc_preview, inline=False)
+    embed.add_field(name='Created by', value=user.mention, inline=True)
+    
+    # Display list of images
+    images_info = issue_data.uploaded_images
+    if images_info:
+        image_lines = []
+        for i, img in enumerate(images_info):
+            image_name = img.filename or f"Image {i+1}"
+            image_url = img.discord_url or img.url
+            if image_url:
+                image_lines.append(f"• **[{image_name}]({image_url})**\n")
+            else:
+                image_lines.append(f"• **{image_name}**\n")
+        image_list_str = "".join(image_lines)
+        
+        embed.add_field(name='Attached Images', value=image_list_str, inline=False)
+        
+        thumbnail_url = images_info[0].discord_url or images_info[0].url
+        if thumbnail_url:
+            embed.set_thumbnail(url=thumbnail_url)
+    else:
+        embed.add_field(name='Attached Images', value='None', inline=False) 
+    embed.set_footer(text=f'{ISSUE_ID_FOOTER_PREFIX}{issue_id}')
+    return embed
+
+def issue_id_from_message(message: Optional[discord.Message]) -> Optional[str]:
+    """Read the issue_id stored in the footer of an issue embed"""
+    if not message or not message.embeds:
+        return None
+    footer_text = message.embeds[0].footer.text or ''
+    if not footer_text.startswith(ISSUE_ID_FOOTER_PREFIX):
+        return None
+    return footer_text[len(ISSUE_ID_FOOTER_PREFIX):]
 
 class IssueModal(discord.ui.Modal):
     """Modal for creating new issues"""
@@ -337,41 +721,25 @@ class IssueModal(discord.ui.Modal):
                     ephemeral=True
                 )
                 return
-            # Clean up old messages before creating new one
-            await cleanup_old_issue_messages()
+            # Clean up old messages in the background, without delaying the submit
+            if pending_issues.has_stale_messages():
+                schedule_background_task(cleanup_old_issue_messages())
             # Create unique ID for this issue
             issue_id = f"{interaction.user.id}_{int(datetime.now().timestamp())}"
-            # Process initial attachments (images et vidéos)
-            initial_uploaded_files = []
-            for attachment in self.attachments:
-                if attachment.content_type and (
-                    attachment.content_type.startswith('image/') or attachment.content_type.startswith('video/')
-                ):
-                    try:
-                        file_data = await attachment.read()
-                        file_url = await github.upload_image_to_github(file_data, attachment.filename)
-                        if file_url:
-                            initial_uploaded_files.append({
-                                'filename': attachment.filename,
-                                'url': file_url,
-                                'discord_url': attachment.url
-                            })
-                    except Exception as e:
-                        print(f"Error processing initial attachment {attachment.filename}: {e}")
+            # Process initial attachments (images et vidéos) en parallèle
+            initial_uploaded_files = await upload_attachments(self.attachments)
             # Store pending issue
-            pending_issues[issue_id] = {
-                'title': title,
-                'description': description,
-                'uploaded_images': initial_uploaded_files,
-                'labels': []  # Ajouté pour éviter le bug
-            }
+            issue = PendingIssue(
+                title=title,
+                description=description,
+                uploaded_images=initial_uploaded_files
+            )
+            pending_issues[issue_id] = issue
             # Send to issues channel
             channel = interaction.client.get_channel(ISSUES_CHANNEL_ID)
             if channel and hasattr(channel, 'send'):
-                view = ChannelIssueView(issue_id)
-                embed = self._create_issue_embed(issue_id, interaction.user)
-                channel_message = await channel.send(embed=embed, view=view)
-                channel_messages[issue_id] = channel_message
+                embed = build_issue_embed(issue_id, interaction.user)
+                issue.message = await channel.send(embed=embed, view=bot.issue_view)
                 # Répondre sans message de confirmation visible
                 await interaction.response.defer()
             else:
@@ -379,194 +747,125 @@ class IssueModal(discord.ui.Modal):
                     'Error: Issues channel not found.', 
                     ephemeral=True
                 )
-        except Exception as e:
-            print(f'Error creating issue via modal: {e}')
+        except Exception:
+            logger.exception('Error creating issue via modal')
             await interaction.response.send_message(
                 'Error creating issue.', 
                 ephemeral=True
             )
-    
-    def _create_issue_embed(self, issue_id: str, user: discord.User | discord.Member) -> discord.Embed:
-        """Create embed for issue display"""
-        if issue_id not in pending_issues:
-            return discord.Embed(
-                title='Error: Issue data not found',
-                color=discord.Color.red()
-            )
-
-        issue_data = pending_issues[issue_id]
-        title = issue_data['title']
-        description = issue_data['description']
-        
-        embed = discord.Embed(
-            title='🔍 New Issue',
-            color=0xffaa00,
-            timestamp=datetime.now()
-        )
-        embed.add_field(name='Title', value=title, inline=False)
-        
-        desc_preview = description[:1024]
-        embed.add_field(name='Description', value=desc_preview, inline=False)
-        embed.add_field(name='Created by', value=user.mention, inline=True)
-        
-        # Display list of images
-        images_info = issue_data.get('uploaded_images', [])
-        if images_info:
-            image_list_str = ""
-            for i, img in enumerate(images_info):
-                image_name = img.get('filename', f"Image {i+1}")
-                image_url = img.get('discord_url') or img.get('url')
-                if image_url:
-                    image_list_str += f"• **[{image_name}]({image_url})**\n"
-                else:
-                    image_list_str += f"• **{image_name}**\n"
-            
-            embed.add_field(name='Attached Images', value=image_list_str, inline=False)
-            
-            if images_info[0].get('discord_url') or images_info[0].get('url'):
-                embed.set_thumbnail(url=images_info[0].get('discord_url') or images_info[0].get('url'))
-        else:
-            embed.add_field(name='Attached Images', value='None', inline=False) 
-        return embed
 
 class ChannelIssueView(discord.ui.View):
-    """View for issues posted in the channel with upload and validate buttons"""
+    """Persistent view for issues posted in the channel with upload and validate buttons
     
-    def __init__(self, issue_id: str):
+    A single instance serves every issue message: the issue_id is read from
+    the embed footer of the message the button belongs to.
+    """
+    
+    def __init__(self):
         super().__init__(timeout=None)
-        self.issue_id = issue_id
-        self.upload_message = None  # Store the upload instruction message
 
-    @discord.ui.button(label='📎 Upload Fichier (Image/Vidéo)', style=discord.ButtonStyle.secondary)
+    @discord.ui.button(label='📎 Upload Fichier (Image/Vidéo)', style=discord.ButtonStyle.secondary, custom_id='issue:upload')
     async def upload_image_file(self, interaction: discord.Interaction, button: discord.ui.Button):
-
-            
-        if self.issue_id not in pending_issues:
+        issue_id = issue_id_from_message(interaction.message)
+        if not issue_id or issue_id not in pending_issues:
             await interaction.response.send_message('This issue no longer exists.', ephemeral=True)
             return
+        issue = pending_issues[issue_id]
         
         # Delete previous upload message if exists
-        if self.upload_message:
-            try:
-                await self.upload_message.delete()
-            except Exception as e:
-                print(f"Error deleting previous upload message: {e}")
+        if issue.upload_message:
+            await _safe_delete(issue.upload_message.delete(), "previous upload message")
         
-        # Send initial message
+        # Send the instruction message (ephemeral), kept for later deletion
         await interaction.response.send_message(
-            'Veuillez envoyer votre image ou vidéo dans un **nouveau message** sur ce salon.'
+            'Veuillez envoyer votre image ou vidéo dans un **nouveau message** sur ce salon.',
+            ephemeral=True
         )
-        
-        # Send the waiting message (ephemeral) and delete the initial message
-        upload_message = await interaction.followup.send(  # type: ignore
-            'En attente de votre image ou vidéo...', ephemeral=True
-        )
-        self.upload_message = upload_message  # type: ignore
-        
-        # Delete the initial message immediately after sending the ephemeral one
-        try:
-            await interaction.delete_original_response()
-        except Exception as e:
-            print(f"Error deleting original response: {e}")
+        issue.upload_message = await interaction.original_response()
         
         # Wait for image or video response
         def check(message):
             return (message.author.id == interaction.user.id and 
                    message.channel.id == interaction.channel_id and
                    message.attachments and 
-                   any(att.content_type and (
-                       att.content_type.startswith('image/') or att.content_type.startswith('video/')
-                   ) for att in message.attachments))
+                   any(is_media_attachment(att) for att in message.attachments))
         
         try:
             message = await interaction.client.wait_for('message', check=check, timeout=120)
             
-            uploaded_count = 0
-            for attachment in message.attachments:
-                if attachment.content_type and (
-                    attachment.content_type.startswith('image/') or attachment.content_type.startswith('video/')
-                ):
-                    try:
-                        file_data = await attachment.read()
-                        file_url = await github.upload_image_to_github(file_data, attachment.filename)
-                        
-                        if file_url:
-                            pending_issues[self.issue_id]['uploaded_images'].append({
-                                'filename': attachment.filename,
-                                'url': file_url,
-                                'discord_url': attachment.url
-                            })
-                            uploaded_count += 1
-                    except Exception as e:
-                        print(f'Error uploading {attachment.filename}: {e}')
+            uploaded_files = await upload_attachments(message.attachments)
+            
+            # L'issue a pu être validée, rejetée ou expirer pendant l'attente :
+            # ne pas écraser le message final avec un embed "not found"
+            if issue_id not in pending_issues:
+                await message.add_reaction('❌')
+                if issue.upload_message:
+                    await _safe_delete(issue.upload_message.delete(), "upload instruction message (issue gone)")
+                    issue.upload_message = None
+                return
+            
+            # Ne compter que les fichiers réellement ajoutés à l'issue
+            issue.uploaded_images.extend(uploaded_files)
+            uploaded_count = len(uploaded_files)
             
             if uploaded_count > 0:
                 await message.add_reaction('✅')
                 # Update the embed
-                original_message = channel_messages.get(self.issue_id)
+                original_message = issue.message
                 if original_message:
-                    new_embed = IssueModal(attachments=[], interaction_user=interaction.user)._create_issue_embed(self.issue_id, interaction.user)
+                    new_embed = build_issue_embed(issue_id, interaction.user)
                     await original_message.edit(embed=new_embed)
                 
                 # Delete the upload instruction message first
-                if self.upload_message:
-                    try:
-                        await self.upload_message.delete()
-                        self.upload_message = None
-                        print("Upload instruction message deleted successfully")
-                    except Exception as e:
-                        print(f"Error deleting upload instruction message: {e}")
+                if issue.upload_message:
+                    await _safe_delete(issue.upload_message.delete(), "upload instruction message")
+                    issue.upload_message = None
                 
                 # Then delete the message with uploaded images to clean the channel
                 try:
                     await asyncio.sleep(2)  # Attendre 2 secondes pour être sûr
                     await message.delete()
-                    print(f"Image message deleted successfully (ID: {message.id})")
+                    logger.debug("Image message deleted successfully (ID: %s)", message.id)
                 except discord.errors.NotFound:
-                    print("Message already deleted")
+                    logger.debug("Message already deleted")
                 except discord.errors.Forbidden:
-                    print(f"Bot doesn't have permission to delete messages in channel {message.channel.name}")
+                    logger.warning("Bot doesn't have permission to delete messages in channel %s", message.channel.name)
                     # Essayer de supprimer après un délai plus long
                     try:
                         await asyncio.sleep(5)
                         await message.delete()
-                        print("Image message deleted after retry")
+                        logger.debug("Image message deleted after retry")
                     except Exception as retry_e:
-                        print(f"Retry failed: {retry_e}")
-                except Exception as e:
-                    print(f"Error deleting image message: {e}")
+                        logger.warning("Retry failed: %s", retry_e)
+                except Exception:
+                    logger.exception("Error deleting image message")
             else:
                 await message.add_reaction('❌')
                 # Delete upload instruction message on failure
-                if self.upload_message:
-                    try:
-                        await self.upload_message.delete()
-                        self.upload_message = None
-                    except Exception as e:
-                        print(f"Error deleting upload instruction message on failure: {e}")
+                if issue.upload_message:
+                    await _safe_delete(issue.upload_message.delete(), "upload instruction message on failure")
+                    issue.upload_message = None
             
         except asyncio.TimeoutError:
             # Delete the upload instruction message on timeout
-            if self.upload_message:
-                try:
-                    await self.upload_message.delete()
-                    self.upload_message = None
-                except Exception as e:
-                    print(f"Error deleting upload instruction message on timeout: {e}")
+            if issue.upload_message:
+                await _safe_delete(issue.upload_message.delete(), "upload instruction message on timeout")
+                issue.upload_message = None
 
-    @discord.ui.button(label='✅ Validate Issue', style=discord.ButtonStyle.success)
+    @discord.ui.button(label='✅ Validate Issue', style=discord.ButtonStyle.success, custom_id='issue:validate')
     async def validate_issue_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         if not isinstance(interaction.user, discord.Member) or not is_staff_or_beta(interaction.user):
             await interaction.response.send_message('Seuls les membres du staff ou les beta-testeurs peuvent valider les issues.', ephemeral=True)
             return
         
-        if self.issue_id not in pending_issues:
+        issue_id = issue_id_from_message(interaction.message)
+        if not issue_id or issue_id not in pending_issues:
             await interaction.response.send_message('This issue no longer exists.', ephemeral=True)
             return
         
         # Créer une vue pour choisir entre validation simple ou avec kanban
         if PROJECT_ID:
-            view = ValidationChoiceView(self.issue_id, interaction)
+            view = ValidationChoiceView(issue_id, interaction)
             await interaction.response.send_message(
                 "Validation de l'issue :", 
                 view=view, 
@@ -575,44 +874,39 @@ class ChannelIssueView(discord.ui.View):
         else:
             # Pas de kanban configuré, validation simple uniquement
             try:
-                await self._create_github_issue(self.issue_id, interaction)
-            except Exception as e:
-                print(f'Error validating issue: {e}')
+                await self._create_github_issue(issue_id, interaction)
+            except Exception:
+                logger.exception('Error validating issue')
                 await interaction.response.send_message('Error creating GitHub issue.', ephemeral=True)
 
-    @discord.ui.button(label='❌ Reject', style=discord.ButtonStyle.danger)
+    @discord.ui.button(label='❌ Reject', style=discord.ButtonStyle.danger, custom_id='issue:reject')
     async def reject_issue(self, interaction: discord.Interaction, button: discord.ui.Button):
         if not isinstance(interaction.user, discord.Member) or not is_staff_or_beta(interaction.user):
             await interaction.response.send_message('Seuls les membres du staff ou les beta-testeurs peuvent rejeter les issues.', ephemeral=True)
             return
         
-        if self.issue_id not in pending_issues:
+        issue_id = issue_id_from_message(interaction.message)
+        if not issue_id or issue_id not in pending_issues:
             await interaction.response.send_message('This issue no longer exists.', ephemeral=True)
             return
         
         # Remove from pending issues
-        del pending_issues[self.issue_id]
+        issue = pending_issues.pop(issue_id)
         
         # Delete the upload instruction message if exists
-        if self.upload_message:
-            try:
-                await self.upload_message.delete()
-            except Exception as e:
-                print(f"Error deleting upload instruction message: {e}")
+        if issue.upload_message:
+            await _safe_delete(issue.upload_message.delete(), "upload instruction message")
         
         # Edit the message to show rejection
         embed = discord.Embed(
             title='❌ Issue Rejected',
             color=0xff0000,
-            timestamp=datetime.now()
+            timestamp=discord.utils.utcnow()
         )
         embed.add_field(name='Status', value=f'Rejected by {interaction.user.mention}', inline=False)
         
         await interaction.response.edit_message(embed=embed, view=None)
         
-        # Remove from channel_messages
-        if self.issue_id in channel_messages:
-            del channel_messages[self.issue_id]
     
     async def _create_github_issue(self, issue_id: str, interaction: discord.Interaction):
         """Create the GitHub issue"""
@@ -623,58 +917,47 @@ class ChannelIssueView(discord.ui.View):
         
         try:
             # Build issue body with all images
-            body = f"""**Description:**
-{issue_data['description']}
-
-"""
+            parts = [f"**Description:**\n{issue_data.description}\n\n"]
             
             # Add all images
-            if issue_data.get('uploaded_images'):
-                body += "**Attached Images:**\n\n"
-                for img in issue_data['uploaded_images']:
-                    image_url_for_github = img.get('url') 
+            if issue_data.uploaded_images:
+                parts.append("**Attached Images:**\n\n")
+                for img in issue_data.uploaded_images:
+                    image_url_for_github = img.url
                     
                     if image_url_for_github:
-                        body += f"![{img.get('filename', 'Attached Image')}]({image_url_for_github})\n"
-                        if img.get('description'):
-                            body += f"*{img['description']}*\n\n"
-                        else:
-                            body += "\n"
-                body += "---\n"
+                        parts.append(f"![{img.filename or 'Attached Image'}]({image_url_for_github})\n\n")
+                parts.append("---\n")
+            body = "".join(parts)
             
             # Create GitHub issue
-            github_issue = github.create_issue(
-                issue_data['title'], 
+            github_issue = await github.create_issue(
+                issue_data.title, 
                 body, 
-                issue_data['labels']
+                issue_data.labels
             )
             
             # Delete the upload instruction message if exists
-            if self.upload_message:
-                try:
-                    await self.upload_message.delete()
-                except Exception as e:
-                    print(f"Error deleting upload instruction message: {e}")
+            if issue_data.upload_message:
+                await _safe_delete(issue_data.upload_message.delete(), "upload instruction message")
             
             # Edit the message to show success
             embed = discord.Embed(
                 title='✅ New Issue Created',
                 color=0x00ff00,
-                timestamp=datetime.now()
+                timestamp=discord.utils.utcnow()
             )
-            embed.add_field(name='Title', value=issue_data['title'], inline=False)
+            embed.add_field(name='Title', value=issue_data.title, inline=False)
             embed.add_field(name='GitHub Issue', value=f"[#{github_issue['number']} - View on GitHub]({github_issue['html_url']})", inline=False)
             embed.add_field(name='Validated by', value=interaction.user.mention, inline=True)
             
             await interaction.response.edit_message(embed=embed, view=None)
             
-            # Remove from pending list and channel_messages
-            del pending_issues[issue_id]
-            if issue_id in channel_messages:
-                del channel_messages[issue_id]
+            # Remove from pending list
+            pending_issues.pop(issue_id, None)
             
-        except Exception as e:
-            print(f'Error creating GitHub issue: {e}')
+        except Exception:
+            logger.exception('Error creating GitHub issue')
             await interaction.response.send_message('Error creating GitHub issue.', ephemeral=True)
 
 class ValidationChoiceView(discord.ui.View):
@@ -690,7 +973,7 @@ class ValidationChoiceView(discord.ui.View):
         await interaction.response.defer()
         
         try:
-            # Récupérer les infos du projet pour les colonnes
+            # Récupérer les infos du projet pour les colonnes (depuis le cache)
             project_info = await github.get_project_info(PROJECT_ID)
             
             if not project_info:
@@ -698,28 +981,21 @@ class ValidationChoiceView(discord.ui.View):
                 return
             
             # Trouver le champ Status et ses options
-            status_field = None
-            for field in project_info.get('fields', {}).get('nodes', []):
-                if field.get('name') == PROJECT_FIELD_STATUS:
-                    status_field = field
-                    break
+            status_field = project_info.get('fields_by_name', {}).get(PROJECT_FIELD_STATUS)
             
             if not status_field or not status_field.get('options'):
                 await interaction.followup.send("Erreur: Champ Status non trouvé dans le projet", ephemeral=True)
                 return
             
             # Supprimer le message de choix
-            try:
-                await interaction.delete_original_response()
-            except Exception as e:
-                print(f"Error deleting choice message: {e}")
+            await _safe_delete(interaction.delete_original_response(), "choice message")
             
             # Créer la vue de sélection du kanban
             kanban_view = KanbanSelectView(self.issue_id, status_field, self.original_interaction)
             await interaction.followup.send("Choisissez ou envoyez l'issue :", view=kanban_view, ephemeral=True)
 
-        except Exception as e:
-            print(f'Erreur validation kanban: {e}')
+        except Exception:
+            logger.exception('Erreur validation kanban')
             await interaction.followup.send("Erreur lors de la préparation du kanban", ephemeral=True)
 
     @discord.ui.button(label='Valider seulement', style=discord.ButtonStyle.secondary)
@@ -728,18 +1004,15 @@ class ValidationChoiceView(discord.ui.View):
         
         try:
             # Supprimer le message de choix
-            try:
-                await interaction.delete_original_response()
-            except Exception as e:
-                print(f"Error deleting choice message: {e}")
+            await _safe_delete(interaction.delete_original_response(), "choice message")
                 
             github_issue = await self._create_github_issue()
             if github_issue:
                 await self._update_success_message(github_issue, False)
             else:
                 await interaction.followup.send("Erreur lors de la création de l'issue", ephemeral=True)
-        except Exception as e:
-            print(f'Erreur validation simple: {e}')
+        except Exception:
+            logger.exception('Erreur validation simple')
             await interaction.followup.send("Erreur lors de la validation", ephemeral=True)
 
     async def _create_github_issue(self) -> Optional[Dict[str, Any]]:
@@ -750,21 +1023,22 @@ class ValidationChoiceView(discord.ui.View):
         issue_data = pending_issues[self.issue_id]
         
         # Construire le body avec images
-        body = f"**Description:**\n{issue_data['description']}\n\n"
+        parts = [f"**Description:**\n{issue_data.description}\n\n"]
         
-        if issue_data.get('uploaded_images'):
-            body += "**Images attachées:**\n\n"
-            for img in issue_data['uploaded_images']:
-                image_url = img.get('url')
-                if image_url:
-                    body += f"![{img.get('filename', 'Image')}]({image_url})\n"
-            body += "---\n"
+        if issue_data.uploaded_images:
+            parts.append("**Images attachées:**\n\n")
+            parts.extend(
+                f"![{img.filename or 'Image'}]({img.url})\n"
+                for img in issue_data.uploaded_images if img.url
+            )
+            parts.append("---\n")
+        body = "".join(parts)
         
         # Créer l'issue
-        return github.create_issue(
-            issue_data['title'], 
+        return await github.create_issue(
+            issue_data.title, 
             body, 
-            issue_data.get('labels', [])
+            issue_data.labels
         )
 
     async def _update_success_message(self, github_issue: Dict[str, Any], added_to_kanban: bool, kanban_column: str = "", error_msg: str = ""):
@@ -772,7 +1046,7 @@ class ValidationChoiceView(discord.ui.View):
         embed = discord.Embed(
             title='✅ Issue créée avec succès',
             color=0x00ff00,
-            timestamp=datetime.now()
+            timestamp=discord.utils.utcnow()
         )
         
         embed.add_field(
@@ -788,16 +1062,23 @@ class ValidationChoiceView(discord.ui.View):
         
         embed.add_field(name='Validée par', value=self.original_interaction.user.mention, inline=True)
         
-        # Récupérer le message original
-        original_message = channel_messages.get(self.issue_id)
+        # Retirer l'issue en attente et récupérer le message original
+        issue = pending_issues.pop(self.issue_id, None)
+        original_message = issue.message if issue else None
         if original_message:
             await original_message.edit(embed=embed, view=None)
-        
-        # Nettoyer
-        if self.issue_id in pending_issues:
-            del pending_issues[self.issue_id]
-        if self.issue_id in channel_messages:
-            del channel_messages[self.issue_id]
+
+@functools.lru_cache(maxsize=16)
+def _build_select_options(field_id: str, options: tuple[tuple[str, str], ...]) -> tuple[discord.SelectOption, ...]:
+    """Build the kanban column select options for a status field, given as (id, name) pairs"""
+    return tuple(
+        discord.SelectOption(
+            label=name,
+            value=option_id,
+            description=f"Envoyer l'issue dans {name}"
+        )
+        for option_id, name in options
+    )
 
 class KanbanSelectView(discord.ui.View):
     """Vue pour sélectionner la colonne du kanban"""
@@ -807,15 +1088,10 @@ class KanbanSelectView(discord.ui.View):
         self.issue_id = issue_id
         self.status_field = status_field
         self.original_interaction = original_interaction
+        self._options_by_id = {option['id']: option['name'] for option in status_field.get('options', [])}
         
-        # Créer le select menu avec les options
-        options = []
-        for option in status_field.get('options', []):
-            options.append(discord.SelectOption(
-                label=option['name'],
-                value=option['id'],
-                description=f"Envoyer l'issue dans {option['name']}"
-            ))
+        # Créer le select menu avec les options (construites une fois par champ Status)
+        options = list(_build_select_options(status_field['id'], tuple(self._options_by_id.items())))
         
         select = discord.ui.Select(
             placeholder="Choix de colonne...",
@@ -825,21 +1101,13 @@ class KanbanSelectView(discord.ui.View):
         select.callback = self.column_selected
         self.add_item(select)
     
-
-    
     async def column_selected(self, interaction: discord.Interaction):
         """Callback quand une colonne est sélectionnée"""
         await interaction.response.defer()
         
         try:
             selected_option_id = interaction.data['values'][0]
-            selected_column_name = None
-            
-            # Trouver le nom de la colonne sélectionnée
-            for option in self.status_field.get('options', []):
-                if option['id'] == selected_option_id:
-                    selected_column_name = option['name']
-                    break
+            selected_column_name = self._options_by_id.get(selected_option_id)
             
             if not selected_column_name:
                 await interaction.followup.send("Erreur: Colonne non trouvée", ephemeral=True)
@@ -853,8 +1121,9 @@ class KanbanSelectView(discord.ui.View):
                 await interaction.followup.send("Erreur lors de la création de l'issue GitHub", ephemeral=True)
                 return
             
-            # Récupérer l'ID GraphQL de l'issue
-            issue_node_id = github.get_issue_node_id(github_issue['number'])
+            # L'ID GraphQL est déjà dans la réponse de création (node_id) :
+            # pas de requête supplémentaire, sauf si GitHub ne l'a pas renvoyé
+            issue_node_id = github_issue.get('node_id') or await github.get_issue_node_id(github_issue['number'])
             
             if not issue_node_id:
                 await validation_view._update_success_message(
@@ -875,38 +1144,41 @@ class KanbanSelectView(discord.ui.View):
             if success:
                 await validation_view._update_success_message(github_issue, True, selected_column_name)
                 # Supprimer le message de sélection de colonne
-                try:
-                    await interaction.delete_original_response()
-                except Exception as e:
-                    print(f"Error deleting column selection message: {e}")
+                await _safe_delete(interaction.delete_original_response(), "column selection message")
                 # Pas de message de confirmation supplémentaire - tout est dans l'embed principal
             else:
+                # Le champ ou la colonne a pu changer côté GitHub : recharger au prochain essai
+                github.invalidate_project_info(PROJECT_ID)
                 await validation_view._update_success_message(
                     github_issue, False, "", 
                     "Issue créée mais erreur lors de l'ajout au kanban"
                 )
                 # Supprimer le message de sélection même en cas d'erreur
-                try:
-                    await interaction.delete_original_response()
-                except Exception as e:
-                    print(f"Error deleting column selection message on error: {e}")
+                await _safe_delete(interaction.delete_original_response(), "column selection message on error")
                 await interaction.followup.send("Issue créée mais erreur lors de l'ajout au kanban", ephemeral=True, delete_after=5)
                 
-        except Exception as e:
-            print(f'Erreur sélection colonne: {e}')
+        except Exception:
+            logger.exception('Erreur sélection colonne')
             await interaction.followup.send("Erreur lors de l'ajout au kanban", ephemeral=True)
 
 class IssueFormView(discord.ui.View):
     """View to open the issue creation form"""
     
     def __init__(self, attachments: Optional[List[discord.Attachment]] = None, ctx=None):
-        super().__init__(timeout=300)
+        super().__init__(timeout=120)
         self.attachments = attachments or []
         self.ctx = ctx
         self.message_to_delete = None
         # Stocke l'auteur du message pour la vérification
         self.author_id = ctx.author.id if ctx and ctx.author else None
 
+    async def on_timeout(self):
+        # Libérer les pièces jointes et le contexte dès l'expiration de la vue
+        self.attachments = []
+        self.ctx = None
+        self.message_to_delete = None
+        self.clear_items()
+
     @discord.ui.button(label='Create Issue', style=discord.ButtonStyle.primary)
     async def open_form(self, interaction: discord.Interaction, button: discord.ui.Button):
         # Vérifie que seul l'auteur peut cliquer
@@ -915,10 +1187,7 @@ class IssueFormView(discord.ui.View):
             return
         # Delete the "click button" message
         if self.message_to_delete:
-            try:
-                await self.message_to_delete.delete()
-            except Exception as e:
-                print(f"Error deleting button message: {e}")
+            await _safe_delete(self.message_to_delete.delete(), "button message")
         modal = IssueModal(self.attachments, interaction.user)
         await interaction.response.send_modal(modal)
 
@@ -938,10 +1207,7 @@ async def create_issue(ctx):
     """
     try:
         # Delete the command message
-        try:
-            await ctx.message.delete()
-        except Exception as e:
-            print(f"Error deleting command message: {e}")
+        await _safe_delete(ctx.message.delete(), "command message")
         
         attachments = ctx.message.attachments
         
@@ -956,10 +1222,106 @@ async def create_issue(ctx):
         # Store the message reference for later deletion
         view.message_to_delete = message
         
-    except Exception as e:
-        print(f'Error creating issue: {e}')
+    except Exception:
+        logger.exception('Error creating issue')
         await ctx.send('Error opening issue creation form.', delete_after=5)
 
+def build_issues_embed(state: str, page: int, issues_data: List[Dict[str, Any]]) -> discord.Embed:
+    """Create the embed listing one page of GitHub issues"""
+    embed = discord.Embed(
+        title=f'{state.title()} Issues',
+        color=ISSUE_STATE_COLORS[state],
+        timestamp=discord.utils.utcnow()
+    )
+    
+    for issue in issues_data:
+        status_emoji = '🟢' if issue['state'] == 'open' else '🔴'
+        
+        # Labels (3 max)
+        labels = issue.get('labels') or ()
+        labels_text = ''.join(f" `{label['name']}`" for label in labels[:3])
+        if len(labels) > 3:
+            labels_text += f' +{len(labels) - 3}'
+        
+        title = issue['title']
+        if len(title) > 60:
+            title = title[:57] + '...'
+        
+        field_name = f'{status_emoji} #{issue["number"]} {title}'
+        field_value = f'[View on GitHub]({issue["html_url"]}){labels_text}'
+        
+        embed.add_field(
+            name=field_name,
+            value=field_value,
+            inline=False
+        )
+    
+    embed.set_footer(text=f'Page {page}')
+    return embed
+
+class IssuesPaginatorView(discord.ui.View):
+    """Previous/Next buttons for the !issues list
+    
+    Pages already fetched are kept for the lifetime of the view, so paging
+    back and forth does not hit GitHub again.
+    """
+    
+    def __init__(self, state: str, page: int, issues_data: List[Dict[str, Any]], author_id: Optional[int] = None):
+        super().__init__(timeout=180)
+        self.state = state
+        self.page = page
+        self.pages: Dict[int, List[Dict[str, Any]]] = {page: issues_data}
+        self.author_id = author_id
+        self.message: Optional[discord.Message] = None
+        self._update_buttons()
+    
+    def _update_buttons(self):
+        self.previous_page.disabled = self.page <= 1
+        self.next_page.disabled = len(self.pages[self.page]) < ISSUES_PER_PAGE
+    
+    async def _show_page(self, interaction: discord.Interaction, page: int):
+        if self.author_id and interaction.user.id != self.author_id:
+            await interaction.response.send_message("Seul l'auteur de la commande peut changer de page.", ephemeral=True)
+            return
+        
+        if page not in self.pages:
+            try:
+                self.pages[page] = await github.get_issues(state=self.state, per_page=ISSUES_PER_PAGE, page=page)
+            except aiohttp.ClientError as e:
+                logger.error('GitHub API error: %s', e)
+                await interaction.response.send_message('Error fetching issues from GitHub.', ephemeral=True)
+                return
+        
+        if not self.pages[page]:
+            # Page vide : la page courante était la dernière
+            del self.pages[page]
+            self.next_page.disabled = True
+            await interaction.response.edit_message(view=self)
+            return
+        
+        self.page = page
+        self._update_buttons()
+        embed = build_issues_embed(self.state, page, self.pages[page])
+        await interaction.response.edit_message(embed=embed, view=self)
+    
+    @discord.ui.button(label='◀ Previous', style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show_page(interaction, self.page - 1)
+    
+    @discord.ui.button(label='Next ▶', style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show_page(interaction, self.page + 1)
+    
+    async def on_timeout(self):
+        # Libérer les pages en cache et retirer les boutons du message
+        self.pages.clear()
+        if self.message:
+            try:
+                await self.message.edit(view=None)
+            except discord.HTTPException as e:
+                logger.debug("Could not remove pagination buttons: %s", e)
+        self.message = None
+
 @bot.command(name='issues')  # type: ignore
 async def list_github_issues(ctx, state: str = 'open', page: int = 1):
     """List GitHub repository issues
@@ -967,64 +1329,56 @@ async def list_github_issues(ctx, state: str = 'open', page: int = 1):
     Examples: !issues, !issues closed, !issues open 2
     """
     try:
-        if state not in ['open', 'closed', 'all']:
+        if state not in ISSUE_STATE_COLORS:
             state = 'open'
         
         if page < 1:
             page = 1
         
-        issues_data = github.get_issues(state=state, per_page=10, page=page)
+        issues_data = await github.get_issues(state=state, per_page=ISSUES_PER_PAGE, page=page)
         
         if not issues_data:
             await ctx.reply(f'No {state} issues found.')
             return
         
-        colors = {'open': 0x28a745, 'closed': 0x6f42c1, 'all': 0x0366d6}
-        
-        embed = discord.Embed(
-            title=f'{state.title()} Issues',
-            color=colors[state],
-            timestamp=datetime.now()
-        )
-        
-        for issue in issues_data:
-            status_emoji = '🟢' if issue['state'] == 'open' else '🔴'
-            
-            # Labels
-            labels_text = ''
-            if issue.get('labels'):
-                labels = [f"`{label['name']}`" for label in issue['labels'][:3]]
-                labels_text = ' ' + ' '.join(labels)
-                if len(issue['labels']) > 3:
-                    labels_text += f' +{len(issue["labels"]) - 3}'
-            
-            title = issue['title']
-            if len(title) > 60:
-                title = title[:57] + '...'
-            
-            field_name = f'{status_emoji} #{issue["number"]} {title}'
-            field_value = f'[View on GitHub]({issue["html_url"]}){labels_text}'
-            
-            embed.add_field(
-                name=field_name,
-                value=field_value,
-                inline=False
-            )
-        
-        nav_text = f'Page {page}'
-        if len(issues_data) == 10:
-            nav_text += f' | `!issues {state} {page + 1}` for next page'
+        embed = build_issues_embed(state, page, issues_data)
+        view = IssuesPaginatorView(state, page, issues_data, ctx.author.id)
+        view.message = await ctx.reply(embed=embed, view=view)
         
-        embed.set_footer(text=nav_text)
-        await ctx.reply(embed=embed)
-        
-    except requests.exceptions.RequestException as e:
-        print(f'GitHub API error: {e}')
+    except aiohttp.ClientError as e:
+        logger.error('GitHub API error: %s', e)
         await ctx.reply('Error fetching issues from GitHub.')
-    except Exception as e:
-        print(f'Error listing issues: {e}')
+    except Exception:
+        logger.exception('Error listing issues')
         await ctx.reply('An error occurred while fetching issues.')
 
+def main():
+    """Configure logging and the event loop, then run the bot
+    
+    Log records are queued and written to stdout by a background thread,
+    so slow writes never block the event loop.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(
+        '[{asctime}] [{levelname:<8}] {name}: {message}', '%Y-%m-%d %H:%M:%S', style='{'
+    ))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(LOG_LEVEL)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
+    listener.start()
+    try:
+        # log_handler=None : discord.py utilise la configuration ci-dessus
+        bot.run(DISCORD_TOKEN, log_handler=None)
+    finally:
+        listener.stop()
 
 # Run the bot
-bot.run(DISCORD_TOKEN)
\ No newline at end of file
+if __name__ == '__main__':
+    main()
\ No newline at end of file